@@ -307,6 +307,100 @@ def assess_ctrcd_severity(
     }
 
 
+# Surveillance schedules by treatment type -> risk category -> phase
+_SURVEILLANCE_PROTOCOLS = {
+    "anthracycline": {
+        "high": {
+            "during": {
+                "echo": "Every 2 cycles",
+                "biomarkers": "Every cycle",
+                "gls": "Every 2 cycles"
+            },
+            "first_year_post": {
+                "echo": "3 and 12 months",
+                "biomarkers": "3 and 12 months"
+            },
+            "long_term": {
+                "echo": "Annual if cumulative dose ≥300 mg/m²",
+                "note": "Lifelong surveillance for childhood cancer survivors"
+            }
+        },
+        "moderate": {
+            "during": {
+                "echo": "After ≥250 mg/m² cumulative dose",
+                "biomarkers": "Every 2 cycles"
+            },
+            "first_year_post": {
+                "echo": "Within 12 months",
+                "biomarkers": "Within 3 months"
+            }
+        },
+        "low": {
+            "during": {
+                "echo": "May consider after ≥250 mg/m²",
+                "biomarkers": "May consider every 2 cycles"
+            },
+            "first_year_post": {
+                "echo": "12 months"
+            }
+        }
+    },
+    "her2": {
+        "high": {
+            "during": {
+                "echo": "Every 3 months",
+                "biomarkers": "Every 2-3 cycles"
+            },
+            "first_year_post": {
+                "echo": "12 months"
+            }
+        },
+        "moderate": {
+            "during": {
+                "echo": "Every 3-4 months",
+                "biomarkers": "Baseline, every 3 months"
+            }
+        },
+        "low": {
+            "during": {
+                "echo": "Every 3-4 months (may reduce after first normal)",
+                "biomarkers": "Optional"
+            }
+        }
+    },
+    "vegfi": {
+        "high": {
+            "during": {
+                "bp": "Every visit + daily home monitoring first cycle",
+                "echo": "Every 3 months in first year",
+                "biomarkers": "Baseline, 4 weeks, then every 3 months"
+            }
+        },
+        "moderate": {
+            "during": {
+                "bp": "Every visit + home monitoring",
+                "echo": "Every 4 months in first year"
+            }
+        },
+        "low": {
+            "during": {
+                "bp": "Every visit",
+                "echo": "Baseline, then if symptoms"
+            }
+        }
+    },
+    "ici": {
+        "high": {
+            "during": {
+                "ecg_troponin": "Baseline, weeks 2, 4, 8, then every 3 months",
+                "echo": "Baseline if high CV risk"
+            }
+        },
+        "note": "Monitor for myocarditis - urgent troponin if symptoms"
+    }
+}
+
+
 def get_surveillance_protocol(
     treatment_type: str,
     risk_category: str,
@@ -323,100 +417,8 @@ def get_surveillance_protocol(
     Returns:
         Detailed surveillance protocol
     """
-    protocols = {
-        "anthracycline": {
-            "high": {
-                "during": {
-                    "echo": "Every 2 cycles",
-                    "biomarkers": "Every cycle",
-                    "gls": "Every 2 cycles"
-                },
-                "first_year_post": {
-                    "echo": "3 and 12 months",
-                    "biomarkers": "3 and 12 months"
-                },
-                "long_term": {
-                    "echo": "Annual if cumulative dose ≥300 mg/m²",
-                    "note": "Lifelong surveillance for childhood cancer survivors"
-                }
-            },
-            "moderate": {
-                "during": {
-                    "echo": "After ≥250 mg/m² cumulative dose",
-                    "biomarkers": "Every 2 cycles"
-                },
-                "first_year_post": {
-                    "echo": "Within 12 months",
-                    "biomarkers": "Within 3 months"
-                }
-            },
-            "low": {
-                "during": {
-                    "echo": "May consider after ≥250 mg/m²",
-                    "biomarkers": "May consider every 2 cycles"
-                },
-                "first_year_post": {
-                    "echo": "12 months"
-                }
-            }
-        },
-        "her2": {
-            "high": {
-                "during": {
-                    "echo": "Every 3 months",
-                    "biomarkers": "Every 2-3 cycles"
-                },
-                "first_year_post": {
-                    "echo": "12 months"
-                }
-            },
-            "moderate": {
-                "during": {
-                    "echo": "Every 3-4 months",
-                    "biomarkers": "Baseline, every 3 months"
-                }
-            },
-            "low": {
-                "during": {
-                    "echo": "Every 3-4 months (may reduce after first normal)",
-                    "biomarkers": "Optional"
-                }
-            }
-        },
-        "vegfi": {
-            "high": {
-                "during": {
-                    "bp": "Every visit + daily home monitoring first cycle",
-                    "echo": "Every 3 months in first year",
-                    "biomarkers": "Baseline, 4 weeks, then every 3 months"
-                }
-            },
-            "moderate": {
-                "during": {
-                    "bp": "Every visit + home monitoring",
-                    "echo": "Every 4 months in first year"
-                }
-            },
-            "low": {
-                "during": {
-                    "bp": "Every visit",
-                    "echo": "Baseline, then if symptoms"
-                }
-            }
-        },
-        "ici": {
-            "high": {
-                "during": {
-                    "ecg_troponin": "Baseline, weeks 2, 4, 8, then every 3 months",
-                    "echo": "Baseline if high CV risk"
-                }
-            },
-            "note": "Monitor for myocarditis - urgent troponin if symptoms"
-        }
-    }
-    
     # Get specific protocol
-    treatment_protocols = protocols.get(treatment_type, {})
+    treatment_protocols = _SURVEILLANCE_PROTOCOLS.get(treatment_type, {})
     risk_protocols = treatment_protocols.get(risk_category, treatment_protocols.get("moderate", {}))
     phase_protocol = risk_protocols.get(treatment_phase, {})
     
@@ -436,7 +438,7 @@ def get_surveillance_protocol(
         "treatment_type": treatment_type,
         "risk_category": risk_category,
         "treatment_phase": treatment_phase,
-        "protocol": phase_protocol,
+        "protocol": dict(phase_protocol),
         "general_notes": general_notes,
         "source": "ESC 2022 Cardio-Oncology Guidelines"
     }
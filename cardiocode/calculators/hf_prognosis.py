@@ -4,10 +4,42 @@ Heart Failure Prognostic Calculators.
 Based on 2021 ESC Heart Failure Guidelines.
 """
 
+from bisect import bisect_left, bisect_right
 from typing import Dict, Any, Optional
 import math
 
 
+# MAGGIC point tables. Each *_BOUNDS tuple holds the lower edge of every band
+# after the first ("value < bound" selects the earlier band), so the points
+# for a value are POINTS[bisect_right(BOUNDS, value)].
+_MAGGIC_AGE_EF_BANDS = (30, 40)
+_MAGGIC_AGE_BOUNDS = (55, 60, 65, 70, 75, 80)
+_MAGGIC_AGE_POINTS = (
+    (0, 1, 2, 4, 6, 8, 10),    # EF < 30
+    (0, 2, 4, 6, 8, 10, 13),   # EF 30-39
+    (0, 3, 5, 7, 9, 12, 15),   # EF >= 40
+)
+_MAGGIC_EF_BOUNDS = (20, 25, 30, 35, 40)
+_MAGGIC_EF_POINTS = (7, 6, 5, 3, 2, 0)
+_MAGGIC_SBP_BOUNDS = (110, 120, 130, 140, 150)
+_MAGGIC_SBP_POINTS = (5, 4, 3, 2, 1, 0)
+_MAGGIC_BMI_BOUNDS = (15, 20, 25, 30)
+_MAGGIC_BMI_POINTS = (6, 5, 3, 2, 0)
+_MAGGIC_CREATININE_BOUNDS = (0.9, 1.1, 1.3, 1.5, 1.7, 1.9, 2.1, 2.3, 2.5)
+_MAGGIC_CREATININE_POINTS = (0, 1, 2, 3, 4, 5, 6, 7, 8, 9)
+
+# Upper (inclusive) score limit of each mortality band: POINTS[bisect_left(...)]
+_MAGGIC_MORTALITY_BOUNDS = (10, 15, 20, 25, 30)
+_MAGGIC_MORTALITY = (
+    ("2-5%", "5-10%", "Low"),
+    ("5-10%", "15-25%", "Low-Intermediate"),
+    ("10-15%", "25-35%", "Intermediate"),
+    ("15-25%", "35-50%", "Intermediate-High"),
+    ("25-35%", "50-65%", "High"),
+    (">35%", ">65%", "Very High"),
+)
+
+
 def calculate_maggic_score(
     age: int,
     male: bool,
@@ -50,125 +82,32 @@ def calculate_maggic_score(
     components = {}
     
     # Age points (varies by EF)
-    if lvef < 30:
-        if age < 55:
-            age_points = 0
-        elif age < 60:
-            age_points = 1
-        elif age < 65:
-            age_points = 2
-        elif age < 70:
-            age_points = 4
-        elif age < 75:
-            age_points = 6
-        elif age < 80:
-            age_points = 8
-        else:
-            age_points = 10
-    elif lvef < 40:
-        if age < 55:
-            age_points = 0
-        elif age < 60:
-            age_points = 2
-        elif age < 65:
-            age_points = 4
-        elif age < 70:
-            age_points = 6
-        elif age < 75:
-            age_points = 8
-        elif age < 80:
-            age_points = 10
-        else:
-            age_points = 13
-    else:  # EF >= 40
-        if age < 55:
-            age_points = 0
-        elif age < 60:
-            age_points = 3
-        elif age < 65:
-            age_points = 5
-        elif age < 70:
-            age_points = 7
-        elif age < 75:
-            age_points = 9
-        elif age < 80:
-            age_points = 12
-        else:
-            age_points = 15
+    ef_band = bisect_right(_MAGGIC_AGE_EF_BANDS, lvef)
+    age_points = _MAGGIC_AGE_POINTS[ef_band][bisect_right(_MAGGIC_AGE_BOUNDS, age)]
     
     score += age_points
     components["age"] = age_points
     
     # LVEF points
-    if lvef < 20:
-        ef_points = 7
-    elif lvef < 25:
-        ef_points = 6
-    elif lvef < 30:
-        ef_points = 5
-    elif lvef < 35:
-        ef_points = 3
-    elif lvef < 40:
-        ef_points = 2
-    else:
-        ef_points = 0
+    ef_points = _MAGGIC_EF_POINTS[bisect_right(_MAGGIC_EF_BOUNDS, lvef)]
     
     score += ef_points
     components["lvef"] = ef_points
     
     # Systolic BP points (inverse relationship in HF)
-    if systolic_bp < 110:
-        bp_points = 5
-    elif systolic_bp < 120:
-        bp_points = 4
-    elif systolic_bp < 130:
-        bp_points = 3
-    elif systolic_bp < 140:
-        bp_points = 2
-    elif systolic_bp < 150:
-        bp_points = 1
-    else:
-        bp_points = 0
+    bp_points = _MAGGIC_SBP_POINTS[bisect_right(_MAGGIC_SBP_BOUNDS, systolic_bp)]
     
     score += bp_points
     components["systolic_bp"] = bp_points
     
     # BMI points (U-shaped relationship)
-    if bmi < 15:
-        bmi_points = 6
-    elif bmi < 20:
-        bmi_points = 5
-    elif bmi < 25:
-        bmi_points = 3
-    elif bmi < 30:
-        bmi_points = 2
-    else:
-        bmi_points = 0
+    bmi_points = _MAGGIC_BMI_POINTS[bisect_right(_MAGGIC_BMI_BOUNDS, bmi)]
     
     score += bmi_points
     components["bmi"] = bmi_points
     
     # Creatinine points
-    if creatinine < 0.9:
-        cr_points = 0
-    elif creatinine < 1.1:
-        cr_points = 1
-    elif creatinine < 1.3:
-        cr_points = 2
-    elif creatinine < 1.5:
-        cr_points = 3
-    elif creatinine < 1.7:
-        cr_points = 4
-    elif creatinine < 1.9:
-        cr_points = 5
-    elif creatinine < 2.1:
-        cr_points = 6
-    elif creatinine < 2.3:
-        cr_points = 7
-    elif creatinine < 2.5:
-        cr_points = 8
-    else:
-        cr_points = 9
+    cr_points = _MAGGIC_CREATININE_POINTS[bisect_right(_MAGGIC_CREATININE_BOUNDS, creatinine)]
     
     score += cr_points
     components["creatinine"] = cr_points
@@ -215,30 +154,9 @@ def calculate_maggic_score(
     
     # Mortality estimation (approximate from MAGGIC curves)
     # These are approximations based on published data
-    if score <= 10:
-        mortality_1yr = "2-5%"
-        mortality_3yr = "5-10%"
-        risk_category = "Low"
-    elif score <= 15:
-        mortality_1yr = "5-10%"
-        mortality_3yr = "15-25%"
-        risk_category = "Low-Intermediate"
-    elif score <= 20:
-        mortality_1yr = "10-15%"
-        mortality_3yr = "25-35%"
-        risk_category = "Intermediate"
-    elif score <= 25:
-        mortality_1yr = "15-25%"
-        mortality_3yr = "35-50%"
-        risk_category = "Intermediate-High"
-    elif score <= 30:
-        mortality_1yr = "25-35%"
-        mortality_3yr = "50-65%"
-        risk_category = "High"
-    else:
-        mortality_1yr = ">35%"
-        mortality_3yr = ">65%"
-        risk_category = "Very High"
+    mortality_1yr, mortality_3yr, risk_category = _MAGGIC_MORTALITY[
+        bisect_left(_MAGGIC_MORTALITY_BOUNDS, score)
+    ]
     
     return {
         "score": score,
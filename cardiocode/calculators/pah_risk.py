@@ -4,10 +4,42 @@ Pulmonary Arterial Hypertension Risk Calculators.
 Based on 2022 ESC/ERS Pulmonary Hypertension Guidelines.
 """
 
-from typing import Dict, Any, Optional, List
+from operator import ge, gt, le, lt
+from typing import Dict, Any, Optional, List, Tuple
 import math
 
 
+# Risk cut-offs per numeric parameter, best stratum first. Each entry is a
+# (comparison, threshold) pair; a value falls in the first stratum whose
+# test passes, or in the worst stratum if none does.
+_BASELINE_CUTOFFS = {
+    "6mwd": ((gt, 440), (ge, 165)),
+    "bnp": ((lt, 50), (le, 800)),
+    "nt_probnp": ((lt, 300), (le, 1100)),
+    "ra_area": ((lt, 18), (le, 26)),
+    "tapse_spap": ((gt, 0.32), (ge, 0.19)),
+    "rap": ((lt, 8), (le, 14)),
+    "cardiac_index": ((ge, 2.5), (ge, 2.0)),
+    "svi": ((gt, 38), (ge, 31)),
+    "svo2": ((gt, 65), (ge, 60)),
+}
+_BASELINE_RISK_LABELS = {1: "low", 2: "intermediate", 3: "high"}
+
+_FOLLOWUP_CUTOFFS = {
+    "6mwd": ((gt, 440), (ge, 320), (ge, 165)),
+    "bnp": ((lt, 50), (lt, 200), (le, 800)),
+    "nt_probnp": ((lt, 300), (lt, 650), (le, 1100)),
+}
+
+
+def _stratum(value: float, cutoffs: Tuple[tuple, ...]) -> int:
+    """Return the 1-based risk stratum of value for the given cut-offs."""
+    for points, (test, threshold) in enumerate(cutoffs, start=1):
+        if test(value, threshold):
+            return points
+    return len(cutoffs) + 1
+
+
 def calculate_pah_baseline_risk(
     who_functional_class: int,
     six_min_walk_distance: Optional[int] = None,
@@ -62,65 +94,18 @@ def calculate_pah_baseline_risk(
         risk_points.append(3)
         assessments["who_fc"] = {"value": who_functional_class, "risk": "high"}
     
-    # 6MWD
-    if six_min_walk_distance is not None:
-        if six_min_walk_distance > 440:
-            risk_points.append(1)
-            assessments["6mwd"] = {"value": six_min_walk_distance, "risk": "low"}
-        elif six_min_walk_distance >= 165:
-            risk_points.append(2)
-            assessments["6mwd"] = {"value": six_min_walk_distance, "risk": "intermediate"}
-        else:
-            risk_points.append(3)
-            assessments["6mwd"] = {"value": six_min_walk_distance, "risk": "high"}
-    
-    # BNP
-    if bnp is not None:
-        if bnp < 50:
-            risk_points.append(1)
-            assessments["bnp"] = {"value": bnp, "risk": "low"}
-        elif bnp <= 800:
-            risk_points.append(2)
-            assessments["bnp"] = {"value": bnp, "risk": "intermediate"}
-        else:
-            risk_points.append(3)
-            assessments["bnp"] = {"value": bnp, "risk": "high"}
-    
-    # NT-proBNP
-    if nt_probnp is not None:
-        if nt_probnp < 300:
-            risk_points.append(1)
-            assessments["nt_probnp"] = {"value": nt_probnp, "risk": "low"}
-        elif nt_probnp <= 1100:
-            risk_points.append(2)
-            assessments["nt_probnp"] = {"value": nt_probnp, "risk": "intermediate"}
-        else:
-            risk_points.append(3)
-            assessments["nt_probnp"] = {"value": nt_probnp, "risk": "high"}
-    
-    # RA area
-    if ra_area is not None:
-        if ra_area < 18:
-            risk_points.append(1)
-            assessments["ra_area"] = {"value": ra_area, "risk": "low"}
-        elif ra_area <= 26:
-            risk_points.append(2)
-            assessments["ra_area"] = {"value": ra_area, "risk": "intermediate"}
-        else:
-            risk_points.append(3)
-            assessments["ra_area"] = {"value": ra_area, "risk": "high"}
-    
-    # TAPSE/sPAP ratio
-    if tapse_spap_ratio is not None:
-        if tapse_spap_ratio > 0.32:
-            risk_points.append(1)
-            assessments["tapse_spap"] = {"value": tapse_spap_ratio, "risk": "low"}
-        elif tapse_spap_ratio >= 0.19:
-            risk_points.append(2)
-            assessments["tapse_spap"] = {"value": tapse_spap_ratio, "risk": "intermediate"}
-        else:
-            risk_points.append(3)
-            assessments["tapse_spap"] = {"value": tapse_spap_ratio, "risk": "high"}
+    # Non-invasive numeric parameters
+    for key, value in (
+        ("6mwd", six_min_walk_distance),
+        ("bnp", bnp),
+        ("nt_probnp", nt_probnp),
+        ("ra_area", ra_area),
+        ("tapse_spap", tapse_spap_ratio),
+    ):
+        if value is not None:
+            points = _stratum(value, _BASELINE_CUTOFFS[key])
+            risk_points.append(points)
+            assessments[key] = {"value": value, "risk": _BASELINE_RISK_LABELS[points]}
     
     # Pericardial effusion
     if pericardial_effusion == "none":
@@ -133,53 +118,17 @@ def calculate_pah_baseline_risk(
         risk_points.append(3)
         assessments["pericardial_effusion"] = {"value": pericardial_effusion, "risk": "high"}
     
-    # RAP (hemodynamic)
-    if rap is not None:
-        if rap < 8:
-            risk_points.append(1)
-            assessments["rap"] = {"value": rap, "risk": "low"}
-        elif rap <= 14:
-            risk_points.append(2)
-            assessments["rap"] = {"value": rap, "risk": "intermediate"}
-        else:
-            risk_points.append(3)
-            assessments["rap"] = {"value": rap, "risk": "high"}
-    
-    # Cardiac index
-    if cardiac_index is not None:
-        if cardiac_index >= 2.5:
-            risk_points.append(1)
-            assessments["cardiac_index"] = {"value": cardiac_index, "risk": "low"}
-        elif cardiac_index >= 2.0:
-            risk_points.append(2)
-            assessments["cardiac_index"] = {"value": cardiac_index, "risk": "intermediate"}
-        else:
-            risk_points.append(3)
-            assessments["cardiac_index"] = {"value": cardiac_index, "risk": "high"}
-    
-    # SVI
-    if svi is not None:
-        if svi > 38:
-            risk_points.append(1)
-            assessments["svi"] = {"value": svi, "risk": "low"}
-        elif svi >= 31:
-            risk_points.append(2)
-            assessments["svi"] = {"value": svi, "risk": "intermediate"}
-        else:
-            risk_points.append(3)
-            assessments["svi"] = {"value": svi, "risk": "high"}
-    
-    # SvO2
-    if svo2 is not None:
-        if svo2 > 65:
-            risk_points.append(1)
-            assessments["svo2"] = {"value": svo2, "risk": "low"}
-        elif svo2 >= 60:
-            risk_points.append(2)
-            assessments["svo2"] = {"value": svo2, "risk": "intermediate"}
-        else:
-            risk_points.append(3)
-            assessments["svo2"] = {"value": svo2, "risk": "high"}
+    # Hemodynamic parameters
+    for key, value in (
+        ("rap", rap),
+        ("cardiac_index", cardiac_index),
+        ("svi", svi),
+        ("svo2", svo2),
+    ):
+        if value is not None:
+            points = _stratum(value, _BASELINE_CUTOFFS[key])
+            risk_points.append(points)
+            assessments[key] = {"value": value, "risk": _BASELINE_RISK_LABELS[points]}
     
     # RV failure signs
     if rv_failure_signs:
@@ -277,50 +226,16 @@ def calculate_pah_followup_risk(
         scores.append(4)
         components["who_fc"] = {"value": who_functional_class, "points": 4}
     
-    # 6MWD (4-strata)
-    if six_min_walk_distance is not None:
-        if six_min_walk_distance > 440:
-            scores.append(1)
-            components["6mwd"] = {"value": six_min_walk_distance, "points": 1}
-        elif six_min_walk_distance >= 320:
-            scores.append(2)
-            components["6mwd"] = {"value": six_min_walk_distance, "points": 2}
-        elif six_min_walk_distance >= 165:
-            scores.append(3)
-            components["6mwd"] = {"value": six_min_walk_distance, "points": 3}
-        else:
-            scores.append(4)
-            components["6mwd"] = {"value": six_min_walk_distance, "points": 4}
-    
-    # BNP (4-strata)
-    if bnp is not None:
-        if bnp < 50:
-            scores.append(1)
-            components["bnp"] = {"value": bnp, "points": 1}
-        elif bnp < 200:
-            scores.append(2)
-            components["bnp"] = {"value": bnp, "points": 2}
-        elif bnp <= 800:
-            scores.append(3)
-            components["bnp"] = {"value": bnp, "points": 3}
-        else:
-            scores.append(4)
-            components["bnp"] = {"value": bnp, "points": 4}
-    
-    # NT-proBNP (4-strata)
-    if nt_probnp is not None:
-        if nt_probnp < 300:
-            scores.append(1)
-            components["nt_probnp"] = {"value": nt_probnp, "points": 1}
-        elif nt_probnp < 650:
-            scores.append(2)
-            components["nt_probnp"] = {"value": nt_probnp, "points": 2}
-        elif nt_probnp <= 1100:
-            scores.append(3)
-            components["nt_probnp"] = {"value": nt_probnp, "points": 3}
-        else:
-            scores.append(4)
-            components["nt_probnp"] = {"value": nt_probnp, "points": 4}
+    # 6MWD and natriuretic peptides (4-strata)
+    for key, value in (
+        ("6mwd", six_min_walk_distance),
+        ("bnp", bnp),
+        ("nt_probnp", nt_probnp),
+    ):
+        if value is not None:
+            points = _stratum(value, _FOLLOWUP_CUTOFFS[key])
+            scores.append(points)
+            components[key] = {"value": value, "points": points}
     
     # Calculate average and round
     if scores:
@@ -5,9 +5,21 @@ Includes PESI, sPESI, Geneva Score, and D-dimer adjustment.
 Based on 2019 ESC Pulmonary Embolism Guidelines.
 """
 
+from bisect import bisect_left
 from typing import Dict, Any, Optional
 
 
+# Upper (inclusive) score limit of PESI classes I-IV; anything above is class V
+_PESI_CLASS_BOUNDS = (65, 85, 105, 125)
+_PESI_CLASSES = (
+    ("I", "0-1.6%", "Very Low"),
+    ("II", "1.7-3.5%", "Low"),
+    ("III", "3.2-7.1%", "Intermediate"),
+    ("IV", "4.0-11.4%", "High"),
+    ("V", "10.0-24.5%", "Very High"),
+)
+
+
 def calculate_pesi(
     age: int,
     male: bool = False,
@@ -87,26 +99,7 @@ def calculate_pesi(
         components["hypoxemia"] = 20
     
     # Risk classification
-    if score <= 65:
-        risk_class = "I"
-        mortality = "0-1.6%"
-        risk_level = "Very Low"
-    elif score <= 85:
-        risk_class = "II"
-        mortality = "1.7-3.5%"
-        risk_level = "Low"
-    elif score <= 105:
-        risk_class = "III"
-        mortality = "3.2-7.1%"
-        risk_level = "Intermediate"
-    elif score <= 125:
-        risk_class = "IV"
-        mortality = "4.0-11.4%"
-        risk_level = "High"
-    else:
-        risk_class = "V"
-        mortality = "10.0-24.5%"
-        risk_level = "Very High"
+    risk_class, mortality, risk_level = _PESI_CLASSES[bisect_left(_PESI_CLASS_BOUNDS, score)]
     
     # Management recommendation
     if risk_class in ["I", "II"]:
@@ -20,7 +20,7 @@ from cardiocode.ingestion.knowledge_manager import KnowledgeManager
 from cardiocode.ingestion.knowledge_extractor import Chapter, Table
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionProposal:
     """Represents a proposed function for user approval."""
     proposal_id: str
@@ -36,7 +36,7 @@ class FunctionProposal:
     status: str = "proposed"  # "proposed", "approved", "rejected", "replaced"
 
 
-@dataclass
+@dataclass(slots=True)
 class WebUpdateProposal:
     """Represents a proposed web update."""
     proposal_id: str
@@ -15,7 +15,7 @@ from dataclasses import dataclass
 from cardiocode.ingestion.knowledge_extractor import Chapter, Table
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """Result of searching for content."""
     chapter: Dict[str, Any]
@@ -5,8 +5,11 @@ Contains:
 - Clinical scoring systems (CHA2DS2-VASc, HAS-BLED, etc.)
 - Medication database with dosing and interactions
 - Contraindication logic
+- Guideline chapter search (loaded on first access)
 """
 
+import importlib
+
 from cardiocode.knowledge.scores import (
     cha2ds2_vasc,
     has_bled,
@@ -18,6 +21,15 @@ from cardiocode.knowledge.scores import (
     ScoreResult,
 )
 
+# Exported lazily (PEP 562) so importing the scores does not pull in the
+# search module and its index handling.
+_LAZY_EXPORTS = {
+    "KnowledgeSearch": "cardiocode.knowledge.search",
+    "search_knowledge": "cardiocode.knowledge.search",
+    "get_knowledge_status": "cardiocode.knowledge.search",
+    "get_chapter_content": "cardiocode.knowledge.search",
+}
+
 __all__ = [
     "cha2ds2_vasc",
     "has_bled", 
@@ -27,4 +39,18 @@ __all__ = [
     "wells_pe",
     "hf2eff_score",
     "ScoreResult",
+    *_LAZY_EXPORTS,
 ]
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -9,10 +9,13 @@ from __future__ import annotations
 import json
 import hashlib
 import re
+import threading
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
+from cardiocode.knowledge.search import _atomic_write
+
 try:
     import fitz  # PyMuPDF
     HAS_PYMUPDF = True
@@ -20,6 +23,43 @@ except ImportError:
     HAS_PYMUPDF = False
 
 
+# Clinical vocabulary used to tag chapters with keywords
+_CLINICAL_TERMS = (
+    # Conditions
+    "aortic stenosis", "mitral regurgitation", "heart failure", "atrial fibrillation",
+    "pulmonary hypertension", "myocardial infarction", "cardiomyopathy",
+    "tricuspid regurgitation", "aortic regurgitation", "mitral stenosis",
+    # Interventions
+    "tavi", "tavr", "savr", "surgery", "intervention", "anticoagulation",
+    "pci", "cabg", "ablation", "pacemaker", "icd", "crt",
+    # Concepts
+    "diagnosis", "treatment", "recommendation", "indication", "contraindication",
+    "risk", "prognosis", "monitoring", "follow-up", "imaging",
+    "echocardiography", "echo", "ct", "mri", "catheterization",
+    # Drug classes
+    "beta blocker", "ace inhibitor", "arb", "diuretic", "antiplatelet",
+    "doac", "warfarin", "statin", "sglt2",
+    # Classification
+    "class i", "class ii", "class iii", "severe", "moderate", "mild",
+    "symptomatic", "asymptomatic",
+)
+_TITLE_WORD_RE = re.compile(r'\b[a-z]{4,}\b')
+_TITLE_STOP_WORDS = frozenset(['with', 'from', 'this', 'that', 'these'])
+
+_SLUG_INVALID_RE = re.compile(r'[^a-z0-9]+')
+_SLUG_REPEAT_RE = re.compile(r'_+')
+_YEAR_RE = re.compile(r'20[12][0-9]')
+
+# guidelines.json is read, updated and written back by each scan, so scans
+# (e.g. concurrent MCP process_pdfs calls) must not overlap
+_PROCESS_LOCK = threading.Lock()
+
+
+def _write_json(path: Path, data: Any):
+    """Write JSON atomically so concurrent readers never see a partial file."""
+    _atomic_write(path, [json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")])
+
+
 class PDFExtractor:
     """Extracts and stores knowledge from guideline PDFs."""
     
@@ -49,8 +89,7 @@ class PDFExtractor:
     def _save_index(self):
         """Save the guidelines index."""
         self.index_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.index_file, 'w', encoding='utf-8') as f:
-            json.dump(self.index, f, indent=2, ensure_ascii=False)
+        _write_json(self.index_file, self.index)
     
     def scan_and_process_all(self) -> Dict[str, Any]:
         """Scan source_pdfs and process any new/changed PDFs."""
@@ -78,8 +117,7 @@ class PDFExtractor:
                 slug = self._make_slug(pdf_path.name, guideline_data.get("year"))
                 chapter_file = self.knowledge_dir / f"{slug}.json"
                 
-                with open(chapter_file, 'w', encoding='utf-8') as f:
-                    json.dump(guideline_data, f, indent=2, ensure_ascii=False)
+                _write_json(chapter_file, guideline_data)
                 
                 # Update index (use posix paths for cross-platform compatibility)
                 self.index["guidelines"][file_hash] = {
@@ -117,8 +155,8 @@ class PDFExtractor:
         """Create a URL-safe slug from filename."""
         # Remove extension and clean
         name = filename.lower().replace('.pdf', '')
-        name = re.sub(r'[^a-z0-9]+', '_', name)
-        name = re.sub(r'_+', '_', name).strip('_')
+        name = _SLUG_INVALID_RE.sub('_', name)
+        name = _SLUG_REPEAT_RE.sub('_', name).strip('_')
         
         # Add year if available
         if year:
@@ -189,7 +227,7 @@ class PDFExtractor:
     def _extract_year(self, filename: str, content: str) -> Optional[int]:
         """Extract publication year."""
         text = filename + " " + content[:500]
-        match = re.search(r'20[12][0-9]', text)
+        match = _YEAR_RE.search(text)
         if match:
             return int(match.group())
         return None
@@ -342,35 +380,11 @@ class PDFExtractor:
         """Generate searchable keywords from content."""
         text = (title + " " + content[:3000]).lower()
         
-        # Clinical terms to look for
-        clinical_terms = [
-            # Conditions
-            "aortic stenosis", "mitral regurgitation", "heart failure", "atrial fibrillation",
-            "pulmonary hypertension", "myocardial infarction", "cardiomyopathy",
-            "tricuspid regurgitation", "aortic regurgitation", "mitral stenosis",
-            # Interventions
-            "tavi", "tavr", "savr", "surgery", "intervention", "anticoagulation",
-            "pci", "cabg", "ablation", "pacemaker", "icd", "crt",
-            # Concepts
-            "diagnosis", "treatment", "recommendation", "indication", "contraindication",
-            "risk", "prognosis", "monitoring", "follow-up", "imaging",
-            "echocardiography", "echo", "ct", "mri", "catheterization",
-            # Drug classes
-            "beta blocker", "ace inhibitor", "arb", "diuretic", "antiplatelet",
-            "doac", "warfarin", "statin", "sglt2",
-            # Classification
-            "class i", "class ii", "class iii", "severe", "moderate", "mild",
-            "symptomatic", "asymptomatic",
-        ]
-        
-        found = []
-        for term in clinical_terms:
-            if term in text:
-                found.append(term)
+        found = [term for term in _CLINICAL_TERMS if term in text]
         
         # Also add significant words from title
-        title_words = re.findall(r'\b[a-z]{4,}\b', title.lower())
-        found.extend([w for w in title_words if w not in ['with', 'from', 'this', 'that', 'these']])
+        title_words = _TITLE_WORD_RE.findall(title.lower())
+        found.extend([w for w in title_words if w not in _TITLE_STOP_WORDS])
         
         return list(set(found))[:20]  # Limit to 20 keywords
 
@@ -378,8 +392,13 @@ class PDFExtractor:
 # Convenience function
 def process_all_pdfs() -> Dict[str, Any]:
     """Process all PDFs in source_pdfs directory."""
-    extractor = PDFExtractor()
-    return extractor.scan_and_process_all()
+    from cardiocode.knowledge.search import KnowledgeSearch
+    
+    with _PROCESS_LOCK:
+        extractor = PDFExtractor()
+        results = extractor.scan_and_process_all()
+        KnowledgeSearch.reload()
+    return results
 
 
 def get_extractor() -> PDFExtractor:
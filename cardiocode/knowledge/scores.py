@@ -12,6 +12,7 @@ All scores include:
 """
 
 from __future__ import annotations
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any, TYPE_CHECKING
 from enum import Enum
@@ -97,6 +98,11 @@ class ScoreResult:
 # ESC AF 2020 Guidelines
 # =============================================================================
 
+# Approximate annual stroke risk (%) indexed by score 0-9
+# Based on validation studies (Lip et al., Chest 2010)
+_CHA2DS2_VASC_ANNUAL_RISK = (0.2, 0.6, 2.2, 3.2, 4.8, 7.2, 9.7, 11.2, 10.8, 12.2)
+
+
 def cha2ds2_vasc(
     age: int,
     sex: str,  # "male" or "female"
@@ -169,13 +175,7 @@ def cha2ds2_vasc(
         components["Female sex"] = 1
     
     # Risk stratification and stroke rates (approximate annual risk %)
-    # Based on validation studies (Lip et al., Chest 2010)
-    risk_table = {
-        0: 0.2, 1: 0.6, 2: 2.2, 3: 3.2, 4: 4.8,
-        5: 7.2, 6: 9.7, 7: 11.2, 8: 10.8, 9: 12.2
-    }
-    
-    annual_risk = risk_table.get(min(score, 9), 15.0)
+    annual_risk = _CHA2DS2_VASC_ANNUAL_RISK[min(score, 9)]
     
     # Determine recommendation based on ESC 2020
     if is_female:
@@ -230,6 +230,10 @@ def cha2ds2_vasc(
 # ESC AF 2020 Guidelines
 # =============================================================================
 
+# Approximate annual major bleeding risk (%) indexed by score 0-5+
+_HAS_BLED_ANNUAL_BLEED_RISK = (1.13, 1.02, 1.88, 3.74, 8.70, 12.5)
+
+
 def has_bled(
     has_hypertension: bool = False,           # SBP > 160 mmHg
     abnormal_renal_function: bool = False,    # Dialysis, transplant, Cr > 2.26
@@ -302,10 +306,7 @@ def has_bled(
         components["Alcohol excess"] = 1
     
     # Annual major bleeding risk (approximate)
-    bleed_risk_table = {
-        0: 1.13, 1: 1.02, 2: 1.88, 3: 3.74, 4: 8.70, 5: 12.5
-    }
-    annual_bleed = bleed_risk_table.get(min(score, 5), 15.0)
+    annual_bleed = _HAS_BLED_ANNUAL_BLEED_RISK[min(score, 5)]
     
     if score >= 3:
         risk_category = "high"
@@ -443,6 +444,19 @@ def nyha_class(
 # ESC NSTE-ACS 2020 Guidelines
 # =============================================================================
 
+# GRACE point tables: POINTS[bisect_right(BOUNDS, value)], where each bound is
+# the lower edge of the next band ("value < bound" stays in the earlier band)
+_GRACE_AGE_BOUNDS = (30, 40, 50, 60, 70, 80, 90)
+_GRACE_AGE_POINTS = (0, 8, 25, 41, 58, 75, 91, 100)
+_GRACE_HR_BOUNDS = (50, 70, 90, 110, 150, 200)
+_GRACE_HR_POINTS = (0, 3, 9, 15, 24, 38, 46)
+_GRACE_SBP_BOUNDS = (80, 100, 120, 140, 160, 200)
+_GRACE_SBP_POINTS = (58, 53, 43, 34, 24, 10, 0)
+_GRACE_CREATININE_BOUNDS = (0.4, 0.8, 1.2, 1.6, 2.0, 4.0)
+_GRACE_CREATININE_POINTS = (1, 4, 7, 10, 13, 21, 28)
+_GRACE_KILLIP_POINTS = {1: 0, 2: 20, 3: 39, 4: 59}
+
+
 def grace_score(
     age: int,
     heart_rate: int,
@@ -482,82 +496,27 @@ def grace_score(
     score = 0
     
     # Age points
-    if age < 30:
-        age_points = 0
-    elif age < 40:
-        age_points = 8
-    elif age < 50:
-        age_points = 25
-    elif age < 60:
-        age_points = 41
-    elif age < 70:
-        age_points = 58
-    elif age < 80:
-        age_points = 75
-    elif age < 90:
-        age_points = 91
-    else:
-        age_points = 100
+    age_points = _GRACE_AGE_POINTS[bisect_right(_GRACE_AGE_BOUNDS, age)]
     score += age_points
     components["Age"] = age_points
     
     # Heart rate points
-    if heart_rate < 50:
-        hr_points = 0
-    elif heart_rate < 70:
-        hr_points = 3
-    elif heart_rate < 90:
-        hr_points = 9
-    elif heart_rate < 110:
-        hr_points = 15
-    elif heart_rate < 150:
-        hr_points = 24
-    elif heart_rate < 200:
-        hr_points = 38
-    else:
-        hr_points = 46
+    hr_points = _GRACE_HR_POINTS[bisect_right(_GRACE_HR_BOUNDS, heart_rate)]
     score += hr_points
     components["Heart rate"] = hr_points
     
     # Systolic BP points (inverse relationship)
-    if systolic_bp < 80:
-        sbp_points = 58
-    elif systolic_bp < 100:
-        sbp_points = 53
-    elif systolic_bp < 120:
-        sbp_points = 43
-    elif systolic_bp < 140:
-        sbp_points = 34
-    elif systolic_bp < 160:
-        sbp_points = 24
-    elif systolic_bp < 200:
-        sbp_points = 10
-    else:
-        sbp_points = 0
+    sbp_points = _GRACE_SBP_POINTS[bisect_right(_GRACE_SBP_BOUNDS, systolic_bp)]
     score += sbp_points
     components["Systolic BP"] = sbp_points
     
     # Creatinine points
-    if creatinine < 0.4:
-        cr_points = 1
-    elif creatinine < 0.8:
-        cr_points = 4
-    elif creatinine < 1.2:
-        cr_points = 7
-    elif creatinine < 1.6:
-        cr_points = 10
-    elif creatinine < 2.0:
-        cr_points = 13
-    elif creatinine < 4.0:
-        cr_points = 21
-    else:
-        cr_points = 28
+    cr_points = _GRACE_CREATININE_POINTS[bisect_right(_GRACE_CREATININE_BOUNDS, creatinine)]
     score += cr_points
     components["Creatinine"] = cr_points
     
     # Killip class points
-    killip_points = {1: 0, 2: 20, 3: 39, 4: 59}
-    kp = killip_points.get(killip_class, 0)
+    kp = _GRACE_KILLIP_POINTS.get(killip_class, 0)
     score += kp
     components["Killip class"] = kp
     
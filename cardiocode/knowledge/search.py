@@ -3,17 +3,140 @@ Knowledge Search for CardioCode.
 
 Provides search across extracted guideline content.
 No embeddings - uses keyword and content matching.
+
+Parsed guideline data is persisted to knowledge/index.bin (a JSON header
+followed by one pickle per guideline) so that startup does not re-parse the
+multi-MB chapter JSON corpus. The binary index is rebuilt automatically
+whenever guidelines.json or a chapter file changes.
 """
 
 from __future__ import annotations
+import functools
+import hashlib
+import heapq
+import itertools
 import json
+import mmap
+import os
+import pickle
 import re
+import sys
+import tempfile
+import threading
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from types import MappingProxyType
+from typing import List, Dict, Any, Iterable, Mapping, NamedTuple, Optional, Tuple
 from dataclasses import dataclass
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+__all__ = [
+    "SearchResult",
+    "KnowledgeSearch",
+    "search_knowledge",
+    "get_knowledge_status",
+    "get_chapter_content",
+]
+
+
+# Bump whenever the structure stored in index.bin changes.
+_INDEX_FORMAT = 7
+
+# index.bin starts with the byte length of its JSON header
+_HEADER_SIZE_BYTES = 8
+
+# What pickle.loads can raise on a truncated or corrupted slice
+_UNPICKLE_ERRORS = (
+    pickle.UnpicklingError, EOFError, ValueError, TypeError,
+    AttributeError, ImportError, IndexError, KeyError,
+)
+
+
+# Query tokenization
+_WORD_RE = re.compile(r'\b\w+\b')
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'for', 'with', 'in', 'of', 'to',
+    'what', 'how', 'when', 'should', 'is', 'are', 'can', 'do', 'does',
+    'patient', 'patients', 'person', 'people',
+})
+
+
+class _ChapterText(NamedTuple):
+    """Lowercased, pre-split text of one chapter, built once per index."""
+    title: str
+    content: str
+    keywords: frozenset
+
+
+def _bounded_count(text: str, term: str, cap: int) -> int:
+    """Count non-overlapping occurrences of term in text, stopping at cap."""
+    count = 0
+    start = 0
+    step = len(term)
+    while count < cap:
+        pos = text.find(term, start)
+        if pos < 0:
+            break
+        count += 1
+        start = pos + step
+    return count
+
+
+def _content_version(digests: Dict[str, bytes]) -> str:
+    """Combine per-file content digests into one version string."""
+    combined = hashlib.blake2b(digest_size=16)
+    for name in sorted(digests):
+        combined.update(name.encode("utf-8"))
+        combined.update(digests[name])
+    return combined.hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def _umask() -> int:
+    """The process umask (read once; os.umask can only be queried by setting it)."""
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
 
-@dataclass
+
+def _atomic_write(path: Path, chunks: Iterable[bytes]):
+    """
+    Write path through a unique temp file published with one os.replace.
+    
+    Concurrent writers never interleave and readers see either the old or
+    the new file. The file gets the mode a plain open() would give it.
+    Raises OSError on failure, leaving no temp file behind.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            if hasattr(os, "fchmod"):
+                # mkstemp creates files as 0600
+                os.fchmod(f.fileno(), 0o666 & ~_umask())
+            f.writelines(chunks)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@dataclass(slots=True)
 class SearchResult:
     """A search result with relevance score."""
     guideline_slug: str
@@ -123,37 +246,228 @@ class KnowledgeSearch:
         self.base_path = Path(base_path)
         self.knowledge_dir = self.base_path / "knowledge" / "chapters"
         self.index_file = self.base_path / "knowledge" / "guidelines.json"
+        self.index_bin = self.base_path / "knowledge" / "index.bin"
         
         # Cache loaded guidelines
         self._guidelines_cache: Dict[str, Dict[str, Any]] = {}
         self._index: Optional[Dict[str, Any]] = None
+        self._offsets: Dict[str, List[int]] = {}
+        self._index_mm: Optional[mmap.mmap] = None
+        self._version: Optional[str] = None
+        self._load_lock = threading.Lock()
+    
+    @classmethod
+    def reload(cls):
+        """Discard the shared searcher so the next lookup re-reads the knowledge base."""
+        _default_searcher.cache_clear()
     
     def _load_index(self) -> Dict[str, Any]:
         """Load the guidelines index."""
-        if self._index is not None:
-            return self._index
+        if self._index is None:
+            self._open_binary_index()
+        return self._index
+    
+    def _load_guideline(self, slug: str) -> Optional[Dict[str, Any]]:
+        """Load a specific guideline's chapter data."""
+        if self._index is None:
+            self._open_binary_index()
+        
+        data = self._guidelines_cache.get(slug)
+        if data is not None or slug not in self._offsets:
+            return data
         
+        # Unpickle only this guideline's slice of index.bin
+        with self._load_lock:
+            data = self._guidelines_cache.get(slug)
+            if data is None and slug in self._offsets:
+                offset, length = self._offsets[slug]
+                try:
+                    data = pickle.loads(memoryview(self._index_mm)[offset:offset + length])
+                except _UNPICKLE_ERRORS:
+                    # A damaged slice would fail on every search until the
+                    # sources change, so drop the binary index and rebuild it
+                    self._rebuild_index(self._source_mtimes())
+                    return self._guidelines_cache.get(slug)
+                self._guidelines_cache[slug] = data
+        return data
+    
+    def _source_mtimes(self) -> Dict[str, int]:
+        """Modification times of the JSON files the binary index is built from."""
+        sources = {}
         if self.index_file.exists():
-            with open(self.index_file, 'r', encoding='utf-8') as f:
-                self._index = json.load(f)
+            sources[self.index_file.name] = self.index_file.stat().st_mtime_ns
+        if self.knowledge_dir.exists():
+            for chapter_file in self.knowledge_dir.glob("*.json"):
+                sources[f"chapters/{chapter_file.name}"] = chapter_file.stat().st_mtime_ns
+        return sources
+    
+    def _open_binary_index(self):
+        """
+        Open index.bin, rebuilding it from the JSON sources if stale.
+        
+        index.bin holds a JSON header followed by the pickled guidelines
+        index and one pickle per guideline. The header records the sources it
+        was built from and each pickle's (offset, length), so every guideline
+        can be unpickled on demand without touching the others. Keeping both
+        in one file means a single os.replace publishes a consistent index.
+        """
+        with self._load_lock:
+            if self._index is not None:
+                return
+            
+            sources = self._source_mtimes()
+            if not self._map_binary_index(sources):
+                self._rebuild_index(sources)
+    
+    def _rebuild_index(self, sources: Dict[str, int]):
+        """Parse the JSON sources, persist them and serve them from memory (caller holds _load_lock)."""
+        index, guidelines, version = self._parse_json_sources()
+        self._write_binary_index(index, guidelines, sources, version)
+        self._index_mm = None
+        self._guidelines_cache = guidelines
+        self._offsets = {}
+        self._version = version
+        self._index = index
+    
+    def _map_binary_index(self, sources: Dict[str, int]) -> bool:
+        """
+        Map index.bin if its recorded sources match the current JSON files.
+        
+        The header is fully validated before any attribute is set, so a
+        rejected file leaves the searcher untouched for the JSON rebuild.
+        """
+        try:
+            with open(self.index_bin, 'rb') as f:
+                index_mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return False
+        
+        try:
+            header_size = int.from_bytes(index_mm[:_HEADER_SIZE_BYTES], "little")
+            payload_start = _HEADER_SIZE_BYTES + header_size
+            if payload_start > len(index_mm):
+                raise ValueError("truncated index header")
+            meta = _loads(index_mm[_HEADER_SIZE_BYTES:payload_start])
+            if meta.get("format") != _INDEX_FORMAT or meta.get("sources") != sources:
+                raise ValueError("stale index")
+            
+            version = meta["version"]
+            if not isinstance(version, str):
+                raise TypeError("index version must be a string")
+            offsets = {}
+            for slug, (offset, length) in meta["guidelines"].items():
+                offsets[slug] = (payload_start + offset, length)
+            index_offset, index_length = meta["index"]
+            index_offset += payload_start
+            for offset, length in itertools.chain(offsets.values(), [(index_offset, index_length)]):
+                if not (payload_start <= offset and 0 <= length and offset + length <= len(index_mm)):
+                    raise ValueError("index slice out of bounds")
+            
+            index = pickle.loads(memoryview(index_mm)[index_offset:index_offset + index_length])
+            if not isinstance(index, dict):
+                raise TypeError("guidelines index must be a dict")
+        except _UNPICKLE_ERRORS:
+            index_mm.close()
+            return False
+        
+        self._index_mm = index_mm
+        self._offsets = offsets
+        self._version = version
+        self._index = index
+        return True
+    
+    def _parse_json_sources(self) -> tuple[Dict[str, Any], Dict[str, Dict[str, Any]], str]:
+        """Parse guidelines.json and every chapter file, hashing their contents."""
+        digests = {}
+        if self.index_file.exists():
+            with open(self.index_file, 'rb') as f:
+                raw = f.read()
+            digests[self.index_file.name] = hashlib.blake2b(raw, digest_size=16).digest()
+            index = _loads(raw)
         else:
-            self._index = {"guidelines": {}, "last_scan": None}
+            index = {"guidelines": {}, "last_scan": None}
         
-        return self._index
+        guidelines = {}
+        if self.knowledge_dir.exists():
+            for chapter_file in self.knowledge_dir.glob("*.json"):
+                with open(chapter_file, 'rb') as f:
+                    raw = f.read()
+                digests[f"chapters/{chapter_file.name}"] = hashlib.blake2b(raw, digest_size=16).digest()
+                data = _loads(raw)
+                self._prepare_guideline(data)
+                guidelines[chapter_file.stem] = data
+        
+        return index, guidelines, _content_version(digests)
     
-    def _load_guideline(self, slug: str) -> Optional[Dict[str, Any]]:
-        """Load a specific guideline's chapter data."""
-        if slug in self._guidelines_cache:
-            return self._guidelines_cache[slug]
+    @staticmethod
+    def _prepare_guideline(data: Dict[str, Any]):
+        """
+        Precompute the lowercased fields used for scoring.
         
-        chapter_file = self.knowledge_dir / f"{slug}.json"
-        if not chapter_file.exists():
-            return None
+        Stored under "_chapters_lc" as one _ChapterText per chapter, parallel
+        to "chapters", so chapter dicts handed back to callers stay unchanged.
+        "_title_exact" maps each lowercased title to its chapter (first
+        occurrence wins, as in a linear scan) for get_chapter.
+        """
+        chapters = data.get("chapters", [])
+        for chapter in chapters:
+            # Keywords come from a small shared vocabulary; interning lets the
+            # pickled index store each distinct keyword once per guideline.
+            if "keywords" in chapter:
+                chapter["keywords"] = [sys.intern(k) for k in chapter["keywords"]]
+        data["_chapters_lc"] = [
+            _ChapterText(
+                chapter.get("title", "").lower(),
+                chapter.get("content", "").lower(),
+                frozenset(sys.intern(k.lower()) for k in chapter.get("keywords", [])),
+            )
+            for chapter in chapters
+        ]
+        title_exact: Dict[str, Dict[str, Any]] = {}
+        for chapter, chapter_lc in zip(chapters, data["_chapters_lc"]):
+            title_exact.setdefault(chapter_lc.title, chapter)
+        data["_title_exact"] = title_exact
+    
+    def _write_binary_index(
+        self,
+        index: Dict[str, Any],
+        guidelines: Dict[str, Dict[str, Any]],
+        sources: Dict[str, int],
+        version: str,
+    ):
+        """
+        Persist the parsed corpus; failures (e.g. read-only install) are ignored.
         
-        with open(chapter_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            self._guidelines_cache[slug] = data
-            return data
+        Each writer uses its own temp file and publishes it with one
+        os.replace, so concurrent rebuilds cannot interleave their output.
+        """
+        meta = {"format": _INDEX_FORMAT, "sources": sources, "version": version, "guidelines": {}}
+        
+        # Offsets are relative to the end of the header
+        blob = pickle.dumps(index, protocol=5)
+        meta["index"] = [0, len(blob)]
+        blobs = [blob]
+        position = len(blob)
+        for slug, data in guidelines.items():
+            blob = pickle.dumps(data, protocol=5)
+            meta["guidelines"][slug] = [position, len(blob)]
+            blobs.append(blob)
+            position += len(blob)
+        header = json.dumps(meta).encode("utf-8")
+        
+        try:
+            _atomic_write(
+                self.index_bin,
+                [len(header).to_bytes(_HEADER_SIZE_BYTES, "little"), header, *blobs],
+            )
+        except OSError:
+            pass
+    
+    @property
+    def version(self) -> str:
+        """Content hash of the knowledge sources; changes whenever they do."""
+        self._load_index()
+        return self._version
     
     def get_status(self) -> Dict[str, Any]:
         """Get status of knowledge base."""
@@ -162,6 +476,7 @@ class KnowledgeSearch:
         
         return {
             "total_guidelines": len(guidelines),
+            "version": self._version,
             "last_scan": index.get("last_scan"),
             "guidelines": [
                 {
@@ -186,9 +501,10 @@ class KnowledgeSearch:
         # Determine which guideline types are most relevant to this query
         relevant_types = self._get_relevant_guideline_types(query_lower)
         
-        results = []
-        
-        # Search each guideline
+        # Each guideline contributes its own top max_results candidates as
+        # (score, slug, guideline, chapter, matched); SearchResults and their
+        # previews are only built for the chapters that make the final cut
+        per_guideline = []
         for file_hash, info in index.get("guidelines", {}).items():
             slug = info.get("slug")
             if not slug:
@@ -198,46 +514,69 @@ class KnowledgeSearch:
             if not guideline:
                 continue
             
-            guideline_type = guideline.get("type", "unknown")
+            per_guideline.append(self._score_guideline(
+                slug, guideline, query_lower, query_terms, relevant_types, max_results
+            ))
+        
+        candidates = heapq.nlargest(
+            max_results, itertools.chain.from_iterable(per_guideline), key=itemgetter(0)
+        )
+        
+        return [
+            SearchResult(
+                guideline_slug=slug,
+                guideline_title=guideline.get("title", "Unknown"),
+                guideline_type=guideline.get("type", "unknown"),
+                guideline_year=guideline.get("year"),
+                chapter_title=chapter.get("title", ""),
+                chapter_number=chapter.get("number", ""),
+                content_preview=f"{chapter.get('content', '')[:500]}...",
+                keywords=list(chapter.get("keywords", [])),
+                matched_terms=matched,
+                score=score,
+                tables=list(chapter.get("tables", [])),
+            )
+            for score, slug, guideline, chapter, matched in candidates
+        ]
+    
+    def _score_guideline(
+        self,
+        slug: str,
+        guideline: Dict[str, Any],
+        query: str,
+        terms: Tuple[str, ...],
+        relevant_types: Mapping[str, int],
+        limit: int,
+    ) -> List[tuple]:
+        """Score every chapter of one guideline and return its top candidates."""
+        guideline_type = guideline.get("type", "unknown")
+        
+        # Calculate guideline-type relevance boost
+        type_boost = 0.0
+        if guideline_type in relevant_types:
+            # Higher boost for more relevant types (based on match count)
+            type_boost = relevant_types[guideline_type] * 5.0  # 5 points per matched concept
+        
+        candidates = []
+        chapters_lc = guideline["_chapters_lc"]
+        for i, chapter in enumerate(guideline.get("chapters", [])):
+            score, matched = self._score_chapter(chapters_lc[i], query, terms)
             
-            # Calculate guideline-type relevance boost
-            type_boost = 0.0
-            if guideline_type in relevant_types:
-                # Higher boost for more relevant types (based on match count)
-                type_boost = relevant_types[guideline_type] * 5.0  # 5 points per matched concept
+            # Apply guideline type boost
+            score += type_boost
             
-            # Search chapters
-            for chapter in guideline.get("chapters", []):
-                score, matched = self._score_chapter(chapter, query_lower, query_terms)
-                
-                # Apply guideline type boost
-                score += type_boost
-                
-                if score > 0:
-                    results.append(SearchResult(
-                        guideline_slug=slug,
-                        guideline_title=guideline.get("title", "Unknown"),
-                        guideline_type=guideline_type,
-                        guideline_year=guideline.get("year"),
-                        chapter_title=chapter.get("title", ""),
-                        chapter_number=chapter.get("number", ""),
-                        content_preview=chapter.get("content", "")[:500] + "...",
-                        keywords=chapter.get("keywords", []),
-                        matched_terms=matched,
-                        score=score,
-                        tables=chapter.get("tables", []),
-                    ))
-        
-        # Sort by score
-        results.sort(key=lambda x: x.score, reverse=True)
-        
-        return results[:max_results]
+            if score > 0:
+                candidates.append((score, slug, guideline, chapter, matched))
+        
+        return heapq.nlargest(limit, candidates, key=itemgetter(0))
     
-    def _get_relevant_guideline_types(self, query: str) -> Dict[str, int]:
-        """Determine which guideline types are most relevant to the query."""
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _get_relevant_guideline_types(query: str) -> Mapping[str, int]:
+        """Determine which guideline types are most relevant to the query (memoized)."""
         relevant_types = {}
         
-        for guideline_type, concepts in self.GUIDELINE_TYPE_RELEVANCE.items():
+        for guideline_type, concepts in KnowledgeSearch.GUIDELINE_TYPE_RELEVANCE.items():
             match_count = 0
             for concept in concepts:
                 if concept in query:
@@ -246,7 +585,7 @@ class KnowledgeSearch:
             if match_count > 0:
                 relevant_types[guideline_type] = match_count
         
-        return relevant_types
+        return MappingProxyType(relevant_types)
     
     # Clinical synonyms for query expansion
     CLINICAL_SYNONYMS = {
@@ -268,36 +607,37 @@ class KnowledgeSearch:
         'screening': ['check-up', 'assessment', 'evaluation'],
     }
     
-    def _extract_terms(self, query: str) -> List[str]:
-        """Extract searchable terms from query with synonym expansion."""
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _extract_terms(query: str) -> Tuple[str, ...]:
+        """Extract searchable terms from query with synonym expansion (memoized)."""
         # Remove common words
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'for', 'with', 'in', 'of', 'to', 
-                      'what', 'how', 'when', 'should', 'is', 'are', 'can', 'do', 'does',
-                      'patient', 'patients', 'person', 'people'}
-        
-        terms = []
-        for word in re.findall(r'\b\w+\b', query):
-            if word not in stop_words and len(word) > 2:
-                terms.append(word)
+        terms = [
+            word for word in _WORD_RE.findall(query)
+            if len(word) > 2 and word not in _STOP_WORDS
+        ]
         
         # Expand with synonyms
         expanded_terms = list(terms)  # Copy original terms
         for term in terms:
-            if term in self.CLINICAL_SYNONYMS:
-                for synonym in self.CLINICAL_SYNONYMS[term]:
+            if term in KnowledgeSearch.CLINICAL_SYNONYMS:
+                for synonym in KnowledgeSearch.CLINICAL_SYNONYMS[term]:
                     if synonym not in expanded_terms:
                         expanded_terms.append(synonym)
         
-        return expanded_terms
+        return tuple(expanded_terms)
     
-    def _score_chapter(self, chapter: Dict, query: str, terms: List[str]) -> tuple[float, List[str]]:
-        """Calculate relevance score for a chapter."""
+    def _score_chapter(
+        self,
+        chapter_lc: _ChapterText,
+        query: str,
+        terms: Tuple[str, ...],
+    ) -> tuple[float, List[str]]:
+        """Calculate relevance score for a chapter from its lowercased fields."""
         score = 0.0
         matched = []
         
-        title = chapter.get("title", "").lower()
-        content = chapter.get("content", "").lower()
-        keywords = [k.lower() for k in chapter.get("keywords", [])]
+        title, content, keywords = chapter_lc
         
         # Title matching (highest weight)
         for term in terms:
@@ -318,9 +658,9 @@ class KnowledgeSearch:
         
         # Content matching
         for term in terms:
-            count = content.count(term)
+            count = _bounded_count(content, term, 10)
             if count > 0:
-                score += min(count * 0.5, 5.0)  # Cap at 5 points per term
+                score += count * 0.5  # Cap at 5 points per term (10 occurrences)
                 if term not in matched:
                     matched.append(term)
         
@@ -336,30 +676,26 @@ class KnowledgeSearch:
         if not guideline:
             return None
         
-        for chapter in guideline.get("chapters", []):
-            if chapter.get("title", "").lower() == chapter_title.lower():
-                return {
-                    "guideline": {
-                        "slug": guideline_slug,
-                        "title": guideline.get("title"),
-                        "type": guideline.get("type"),
-                        "year": guideline.get("year"),
-                    },
-                    "chapter": chapter,
-                }
+        title_lower = chapter_title.lower()
+        chapter = guideline["_title_exact"].get(title_lower)
+        if chapter is None:
+            # Try partial match
+            for candidate, chapter_lc in zip(guideline.get("chapters", []), guideline["_chapters_lc"]):
+                if title_lower in chapter_lc.title:
+                    chapter = candidate
+                    break
         
-        # Try partial match
-        for chapter in guideline.get("chapters", []):
-            if chapter_title.lower() in chapter.get("title", "").lower():
-                return {
-                    "guideline": {
-                        "slug": guideline_slug,
-                        "title": guideline.get("title"),
-                        "type": guideline.get("type"),
-                        "year": guideline.get("year"),
-                    },
-                    "chapter": chapter,
-                }
+        if chapter is not None:
+            return {
+                "guideline": {
+                    "slug": guideline_slug,
+                    "title": guideline.get("title"),
+                    "type": guideline.get("type"),
+                    "year": guideline.get("year"),
+                },
+                # Copy so callers can't alter the cached chapter
+                "chapter": dict(chapter),
+            }
         
         return None
     
@@ -390,18 +726,23 @@ class KnowledgeSearch:
 
 
 # Convenience functions
+@functools.lru_cache(maxsize=1)
+def _default_searcher() -> KnowledgeSearch:
+    """Shared searcher so the corpus is loaded once per process."""
+    return KnowledgeSearch()
+
+
 def search_knowledge(query: str, max_results: int = 5) -> List[Dict[str, Any]]:
     """Search the knowledge base."""
-    searcher = KnowledgeSearch()
-    results = searcher.search(query, max_results)
+    results = _default_searcher().search(query, max_results)
     return [r.to_dict() for r in results]
 
 
 def get_knowledge_status() -> Dict[str, Any]:
     """Get knowledge base status."""
-    return KnowledgeSearch().get_status()
+    return _default_searcher().get_status()
 
 
 def get_chapter_content(guideline_slug: str, chapter_title: str) -> Optional[Dict[str, Any]]:
     """Get full chapter content."""
-    return KnowledgeSearch().get_chapter(guideline_slug, chapter_title)
+    return _default_searcher().get_chapter(guideline_slug, chapter_title)
@@ -4,6 +4,13 @@ CardioCode MCP Server.
 Model Context Protocol server exposing CardioCode as tools for LLMs.
 """
 
-from cardiocode.mcp.server import serve
-
 __all__ = ["serve"]
+
+
+def __getattr__(name):
+    # Resolved on first access so importing cardiocode.mcp.tools does not
+    # pull in the server module and the MCP SDK.
+    if name == "serve":
+        from cardiocode.mcp.server import serve
+        return serve
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,9 +8,10 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import re
 import sys
 import inspect
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, stream=sys.stderr)
@@ -27,9 +28,48 @@ except ImportError:
     MCP_AVAILABLE = False
     logger.warning("MCP package not available")
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import uvloop
+    # uvloop.run() only exists from 0.18; older installs use asyncio.run()
+    HAS_UVLOOP = hasattr(uvloop, "run")
+except ImportError:
+    HAS_UVLOOP = False
+
 # Import tools
 from cardiocode.mcp.tools import TOOL_REGISTRY, call_tool
 
+# Docstring "Args:" section (up to "Returns:") and the "name: description"
+# entries inside it, each with any wrapped continuation lines
+_ARGS_BLOCK_RE = re.compile(r"^[ \t]*Args:[^\n]*\n(.*?)(?=^[ \t]*Returns:|\Z)", re.MULTILINE | re.DOTALL)
+_PARAM_RE = re.compile(r"^[ \t]*([^:\n]*?)[ \t]*:[ \t]*([^\n]*?)[ \t]*$((?:\n[^:\n]*$)*)", re.MULTILINE)
+
+
+# json.dumps builds a new encoder whenever non-default options are passed
+_JSON_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+
+
+def _dumps(result: Dict[str, Any]) -> str:
+    """Serialize a tool result as indented JSON, using orjson when it is installed."""
+    if HAS_ORJSON:
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return _JSON_ENCODER.encode(result)
+
+
+def _param_schema(param: inspect.Parameter, description: Optional[str]) -> Dict[str, Any]:
+    """Build the JSON schema for one tool parameter."""
+    param_schema = {"type": "string"}  # MCP sends everything as strings
+    if description is not None:
+        param_schema["description"] = description
+    if param.default is not inspect.Parameter.empty and param.default is not None:
+        param_schema["default"] = str(param.default)
+    return param_schema
+
 
 def _build_tool_schema(name: str, func) -> Dict[str, Any]:
     """Build JSON schema from function signature."""
@@ -38,47 +78,30 @@ def _build_tool_schema(name: str, func) -> Dict[str, Any]:
     
     # Parse docstring for parameter descriptions
     param_docs = {}
-    in_args = False
-    current_param = None
-    
-    for line in doc.split("\n"):
-        line_stripped = line.strip()
-        if line_stripped.startswith("Args:"):
-            in_args = True
-            continue
-        if line_stripped.startswith("Returns:"):
-            in_args = False
-            continue
-        if in_args and ":" in line_stripped:
-            parts = line_stripped.split(":", 1)
-            if len(parts) == 2:
-                param_name = parts[0].strip()
-                param_desc = parts[1].strip()
-                param_docs[param_name] = param_desc
-                current_param = param_name
-        elif in_args and current_param and line_stripped:
-            param_docs[current_param] += " " + line_stripped
+    args_block = _ARGS_BLOCK_RE.search(doc)
+    if args_block:
+        for param_name, param_desc, continuation in _PARAM_RE.findall(args_block.group(1)):
+            # Wrapped description lines are joined with single spaces
+            for extra in continuation.split("\n"):
+                extra = extra.strip()
+                if extra:
+                    param_desc += " " + extra
+            param_docs[param_name] = param_desc
     
     # Build properties from signature
-    properties = {}
-    required = []
-    
-    for param_name, param in sig.parameters.items():
-        param_schema = {"type": "string"}  # MCP sends everything as strings
-        
-        if param_name in param_docs:
-            param_schema["description"] = param_docs[param_name]
-        
-        if param.default == inspect.Parameter.empty:
-            required.append(param_name)
-        elif param.default is not None:
-            param_schema["default"] = str(param.default)
-        
-        properties[param_name] = param_schema
+    params = sig.parameters
+    properties = {
+        param_name: _param_schema(param, param_docs.get(param_name))
+        for param_name, param in params.items()
+    }
+    required = [
+        param_name for param_name, param in params.items()
+        if param.default is inspect.Parameter.empty
+    ]
     
     return {
         "name": name,
-        "description": doc.split("\n")[0].strip() if doc else f"CardioCode tool: {name}",
+        "description": doc.strip().partition("\n")[0].rstrip() or f"CardioCode tool: {name}",
         "inputSchema": {
             "type": "object",
             "properties": properties,
@@ -91,28 +114,37 @@ if MCP_AVAILABLE:
     # Create MCP server
     server = Server("cardiocode")
     
+    # Schemas depend only on the registered signatures and docstrings,
+    # so build them once instead of on every list_tools request
+    _TOOL_SCHEMAS = {
+        name: _build_tool_schema(name, info.function)
+        for name, info in TOOL_REGISTRY.items()
+    }
+    _TOOLS = [
+        Tool(
+            name=schema["name"],
+            description=schema["description"],
+            inputSchema=schema["inputSchema"],
+        )
+        for schema in _TOOL_SCHEMAS.values()
+    ]
+    
     @server.list_tools()
     async def list_tools():
         """List all available tools."""
-        tools = []
-        for name, info in TOOL_REGISTRY.items():
-            schema = _build_tool_schema(name, info["function"])
-            tools.append(Tool(
-                name=schema["name"],
-                description=schema["description"],
-                inputSchema=schema["inputSchema"],
-            ))
-        return tools
+        return list(_TOOLS)
     
     @server.call_tool()
     async def handle_call_tool(name: str, arguments: Dict[str, Any]):
         """Handle tool calls."""
         try:
-            result = call_tool(name, arguments or {})
+            # Tools are synchronous - run them off the event loop so a slow
+            # one (PDF processing, first knowledge load) doesn't stall the server
+            result = await asyncio.to_thread(call_tool, name, arguments or {})
             
             # Convert result to JSON string
             if isinstance(result, dict):
-                result_text = json.dumps(result, indent=2, ensure_ascii=False)
+                result_text = _dumps(result)
             else:
                 result_text = str(result)
             
@@ -143,7 +175,10 @@ async def main():
 
 def serve():
     """Entry point for module execution."""
-    asyncio.run(main())
+    if HAS_UVLOOP:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
 
 
 if __name__ == "__main__":
@@ -5,8 +5,8 @@ All tools exposed via the MCP server.
 """
 
 from __future__ import annotations
-import json
-from typing import Dict, Any, List, Optional, Union
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Union
 
 # Import calculator modules
 from cardiocode.calculators import (
@@ -110,6 +110,13 @@ def _to_float(value: Union[str, float, int, None], default: Optional[float] = 0.
     return default
 
 
+def _split_csv(value: Optional[str]) -> List[str]:
+    """Split a comma-separated string into stripped, non-empty items."""
+    if not value:
+        return []
+    return [item for item in (part.strip() for part in value.split(",")) if item]
+
+
 # =============================================================================
 # CLINICAL SCORE TOOLS
 # =============================================================================
@@ -820,6 +827,14 @@ def tool_calculate_brugada_risk(
 # ASSESSMENT TOOLS
 # =============================================================================
 
+# Fixed caveats appended to every aortic stenosis assessment
+_AORTIC_STENOSIS_NOTES = (
+    "Low-flow defined as SVI < 35 mL/m2",
+    "Low-gradient defined as mean gradient < 40 mmHg",
+    "For low-flow low-gradient AS, dobutamine stress echo or CT calcium scoring recommended",
+)
+
+
 def tool_assess_aortic_stenosis(
     peak_velocity: str,
     mean_gradient: str,
@@ -904,15 +919,19 @@ def tool_assess_aortic_stenosis(
             "svi_ml_m2": svi,
         },
         "recommendations": recommendations,
-        "notes": [
-            "Low-flow defined as SVI < 35 mL/m2",
-            "Low-gradient defined as mean gradient < 40 mmHg",
-            "For low-flow low-gradient AS, dobutamine stress echo or CT calcium scoring recommended"
-        ],
+        "notes": _AORTIC_STENOSIS_NOTES,
         "source": "ESC/EACTS 2021/2025 VHD Guidelines"
     }
 
 
+# Fixed caveats appended to every ICD indication assessment
+_ICD_INDICATION_NOTES = (
+    "Ensure optimal medical therapy for >= 3 months before ICD",
+    "Life expectancy > 1 year with good functional status required",
+    "CRT-D may be preferred if QRS >= 130ms with LBBB",
+)
+
+
 def tool_assess_icd_indication(
     lvef: str,
     nyha_class: str,
@@ -991,11 +1010,7 @@ def tool_assess_icd_indication(
             "syncope": has_syncope,
             "days_post_mi": post_mi_days,
         },
-        "notes": [
-            "Ensure optimal medical therapy for >= 3 months before ICD",
-            "Life expectancy > 1 year with good functional status required",
-            "CRT-D may be preferred if QRS >= 130ms with LBBB"
-        ],
+        "notes": _ICD_INDICATION_NOTES,
         "source": "ESC 2022 VA/SCD Guidelines"
     }
 
@@ -1483,7 +1498,7 @@ def tool_pathway_hfref_treatment(
 ) -> Dict[str, Any]:
     """HFrEF treatment pathway - determine next therapy step."""
     # Parse medications list
-    meds = [m.strip() for m in current_medications.split(",")] if current_medications else []
+    meds = _split_csv(current_medications)
     return pathway_hfref_treatment(
         current_medications=meds,
         lvef=_to_float(lvef, 35),
@@ -1659,12 +1674,9 @@ def tool_search_knowledge(query: str, max_results: str = "3") -> Dict[str, Any]:
     """
     from cardiocode.knowledge.search import search_knowledge
 
-    results = search_knowledge(query, _to_int(max_results, 3))
-
-    # Truncate previews to save tokens
-    for r in results:
-        if "preview" in r and len(r["preview"]) > 500:
-            r["preview"] = r["preview"][:500] + "..."
+    # Previews are already capped at 500 chars by the search layer;
+    # keep the result count within 1-50 whatever the client asks for
+    results = search_knowledge(query, max(1, min(_to_int(max_results, 3), 50)))
 
     return {
         "query": query,
@@ -1705,10 +1717,12 @@ def tool_get_chapter(guideline_slug: str, chapter_title: str, max_chars: str = "
 
     # Truncate content to save tokens
     limit = _to_int(max_chars, 3000)
-    if limit > 0 and "chapter" in result and "content" in result["chapter"]:
-        content = result["chapter"]["content"]
-        if len(content) > limit:
-            result["chapter"]["content"] = content[:limit] + f"\n\n... [truncated, {len(content) - limit} more chars available - use max_chars='0' for full]"
+    chapter = result["chapter"]
+    content = chapter.get("content")
+    if limit > 0 and content is not None:
+        extra = len(content) - limit
+        if extra > 0:
+            chapter["content"] = f"{content[:limit]}\n\n... [truncated, {extra} more chars available - use max_chars='0' for full]"
             result["truncated"] = True
 
     return result
@@ -1718,300 +1732,311 @@ def tool_get_chapter(guideline_slug: str, chapter_title: str, max_chars: str = "
 # TOOL REGISTRY
 # =============================================================================
 
-TOOL_REGISTRY = {
+class ToolInfo(NamedTuple):
+    """A registered MCP tool and its short description."""
+    function: Callable[..., Any]
+    description: str
+
+
+TOOL_REGISTRY = MappingProxyType({
     # ==========================================================================
     # ORIGINAL CLINICAL SCORES
     # ==========================================================================
-    "calculate_cha2ds2_vasc": {
-        "function": tool_calculate_cha2ds2_vasc,
-        "description": "Calculate CHA2DS2-VASc stroke risk score for atrial fibrillation",
-    },
-    "calculate_has_bled": {
-        "function": tool_calculate_has_bled,
-        "description": "Calculate HAS-BLED bleeding risk score",
-    },
-    "calculate_grace_score": {
-        "function": tool_calculate_grace_score,
-        "description": "Calculate GRACE score for ACS risk stratification",
-    },
-    "calculate_wells_pe": {
-        "function": tool_calculate_wells_pe,
-        "description": "Calculate Wells score for pulmonary embolism probability",
-    },
-    "calculate_hcm_scd_risk": {
-        "function": tool_calculate_hcm_scd_risk,
-        "description": "Calculate 5-year SCD risk in hypertrophic cardiomyopathy",
-    },
+    "calculate_cha2ds2_vasc": ToolInfo(
+        function=tool_calculate_cha2ds2_vasc,
+        description="Calculate CHA2DS2-VASc stroke risk score for atrial fibrillation",
+    ),
+    "calculate_has_bled": ToolInfo(
+        function=tool_calculate_has_bled,
+        description="Calculate HAS-BLED bleeding risk score",
+    ),
+    "calculate_grace_score": ToolInfo(
+        function=tool_calculate_grace_score,
+        description="Calculate GRACE score for ACS risk stratification",
+    ),
+    "calculate_wells_pe": ToolInfo(
+        function=tool_calculate_wells_pe,
+        description="Calculate Wells score for pulmonary embolism probability",
+    ),
+    "calculate_hcm_scd_risk": ToolInfo(
+        function=tool_calculate_hcm_scd_risk,
+        description="Calculate 5-year SCD risk in hypertrophic cardiomyopathy",
+    ),
     
     # ==========================================================================
     # NEW PE/VTE CALCULATORS
     # ==========================================================================
-    "calculate_pesi": {
-        "function": tool_calculate_pesi,
-        "description": "Calculate PESI score for PE 30-day mortality prediction",
-    },
-    "calculate_spesi": {
-        "function": tool_calculate_spesi,
-        "description": "Calculate Simplified PESI (sPESI) for PE risk stratification",
-    },
-    "calculate_geneva_pe": {
-        "function": tool_calculate_geneva_pe,
-        "description": "Calculate Revised Geneva Score for PE pre-test probability",
-    },
-    "calculate_age_adjusted_ddimer": {
-        "function": tool_calculate_age_adjusted_ddimer,
-        "description": "Calculate age-adjusted D-dimer cutoff for PE exclusion",
-    },
+    "calculate_pesi": ToolInfo(
+        function=tool_calculate_pesi,
+        description="Calculate PESI score for PE 30-day mortality prediction",
+    ),
+    "calculate_spesi": ToolInfo(
+        function=tool_calculate_spesi,
+        description="Calculate Simplified PESI (sPESI) for PE risk stratification",
+    ),
+    "calculate_geneva_pe": ToolInfo(
+        function=tool_calculate_geneva_pe,
+        description="Calculate Revised Geneva Score for PE pre-test probability",
+    ),
+    "calculate_age_adjusted_ddimer": ToolInfo(
+        function=tool_calculate_age_adjusted_ddimer,
+        description="Calculate age-adjusted D-dimer cutoff for PE exclusion",
+    ),
     
     # ==========================================================================
     # NEW PAH CALCULATORS
     # ==========================================================================
-    "calculate_pah_baseline_risk": {
-        "function": tool_calculate_pah_baseline_risk,
-        "description": "Calculate PAH baseline risk using 3-strata model (1-year mortality)",
-    },
-    "calculate_pah_followup_risk": {
-        "function": tool_calculate_pah_followup_risk,
-        "description": "Calculate PAH follow-up risk using simplified 4-strata model",
-    },
-    "classify_ph_hemodynamics": {
-        "function": tool_classify_ph_hemodynamics,
-        "description": "Classify pulmonary hypertension by hemodynamic definitions",
-    },
+    "calculate_pah_baseline_risk": ToolInfo(
+        function=tool_calculate_pah_baseline_risk,
+        description="Calculate PAH baseline risk using 3-strata model (1-year mortality)",
+    ),
+    "calculate_pah_followup_risk": ToolInfo(
+        function=tool_calculate_pah_followup_risk,
+        description="Calculate PAH follow-up risk using simplified 4-strata model",
+    ),
+    "classify_ph_hemodynamics": ToolInfo(
+        function=tool_classify_ph_hemodynamics,
+        description="Classify pulmonary hypertension by hemodynamic definitions",
+    ),
     
     # ==========================================================================
     # NEW HF CALCULATORS
     # ==========================================================================
-    "calculate_maggic_score": {
-        "function": tool_calculate_maggic_score,
-        "description": "Calculate MAGGIC score for HF 1-year and 3-year mortality",
-    },
-    "assess_iron_deficiency_hf": {
-        "function": tool_assess_iron_deficiency_hf,
-        "description": "Assess iron deficiency in HF patients and IV iron indication",
-    },
-    "classify_hf_phenotype": {
-        "function": tool_classify_hf_phenotype,
-        "description": "Classify HF phenotype (HFrEF, HFmrEF, HFpEF) by LVEF",
-    },
+    "calculate_maggic_score": ToolInfo(
+        function=tool_calculate_maggic_score,
+        description="Calculate MAGGIC score for HF 1-year and 3-year mortality",
+    ),
+    "assess_iron_deficiency_hf": ToolInfo(
+        function=tool_assess_iron_deficiency_hf,
+        description="Assess iron deficiency in HF patients and IV iron indication",
+    ),
+    "classify_hf_phenotype": ToolInfo(
+        function=tool_classify_hf_phenotype,
+        description="Classify HF phenotype (HFrEF, HFmrEF, HFpEF) by LVEF",
+    ),
     
     # ==========================================================================
     # NEW ARRHYTHMIA RISK CALCULATORS
     # ==========================================================================
-    "calculate_lmna_risk": {
-        "function": tool_calculate_lmna_risk,
-        "description": "Calculate 5-year VA risk in LMNA mutation carriers",
-    },
-    "calculate_lqts_risk": {
-        "function": tool_calculate_lqts_risk,
-        "description": "Estimate arrhythmic risk in Long QT Syndrome",
-    },
-    "calculate_brugada_risk": {
-        "function": tool_calculate_brugada_risk,
-        "description": "Risk stratification in Brugada Syndrome",
-    },
+    "calculate_lmna_risk": ToolInfo(
+        function=tool_calculate_lmna_risk,
+        description="Calculate 5-year VA risk in LMNA mutation carriers",
+    ),
+    "calculate_lqts_risk": ToolInfo(
+        function=tool_calculate_lqts_risk,
+        description="Estimate arrhythmic risk in Long QT Syndrome",
+    ),
+    "calculate_brugada_risk": ToolInfo(
+        function=tool_calculate_brugada_risk,
+        description="Risk stratification in Brugada Syndrome",
+    ),
     
     # ==========================================================================
     # ORIGINAL ASSESSMENTS
     # ==========================================================================
-    "assess_aortic_stenosis": {
-        "function": tool_assess_aortic_stenosis,
-        "description": "Assess aortic stenosis severity and intervention indication",
-    },
-    "assess_icd_indication": {
-        "function": tool_assess_icd_indication,
-        "description": "Assess ICD indication for sudden cardiac death prevention",
-    },
+    "assess_aortic_stenosis": ToolInfo(
+        function=tool_assess_aortic_stenosis,
+        description="Assess aortic stenosis severity and intervention indication",
+    ),
+    "assess_icd_indication": ToolInfo(
+        function=tool_assess_icd_indication,
+        description="Assess ICD indication for sudden cardiac death prevention",
+    ),
     
     # ==========================================================================
     # NEW VALVULAR ASSESSMENTS
     # ==========================================================================
-    "assess_ar_severity": {
-        "function": tool_assess_ar_severity,
-        "description": "Assess aortic regurgitation severity and intervention indication",
-    },
-    "assess_mr_primary_intervention": {
-        "function": tool_assess_mr_primary_intervention,
-        "description": "Assess primary mitral regurgitation intervention indication",
-    },
-    "assess_mr_secondary_teer": {
-        "function": tool_assess_mr_secondary_teer,
-        "description": "Assess secondary MR eligibility for TEER (MitraClip)",
-    },
-    "assess_tr_intervention": {
-        "function": tool_assess_tr_intervention,
-        "description": "Assess tricuspid regurgitation intervention indication",
-    },
-    "assess_ms_intervention": {
-        "function": tool_assess_ms_intervention,
-        "description": "Assess mitral stenosis intervention indication",
-    },
-    "assess_valve_type_selection": {
-        "function": tool_assess_valve_type_selection,
-        "description": "Assess mechanical vs biological valve selection",
-    },
-    "calculate_inr_target_mhv": {
-        "function": tool_calculate_inr_target_mhv,
-        "description": "Calculate INR target for mechanical heart valve",
-    },
+    "assess_ar_severity": ToolInfo(
+        function=tool_assess_ar_severity,
+        description="Assess aortic regurgitation severity and intervention indication",
+    ),
+    "assess_mr_primary_intervention": ToolInfo(
+        function=tool_assess_mr_primary_intervention,
+        description="Assess primary mitral regurgitation intervention indication",
+    ),
+    "assess_mr_secondary_teer": ToolInfo(
+        function=tool_assess_mr_secondary_teer,
+        description="Assess secondary MR eligibility for TEER (MitraClip)",
+    ),
+    "assess_tr_intervention": ToolInfo(
+        function=tool_assess_tr_intervention,
+        description="Assess tricuspid regurgitation intervention indication",
+    ),
+    "assess_ms_intervention": ToolInfo(
+        function=tool_assess_ms_intervention,
+        description="Assess mitral stenosis intervention indication",
+    ),
+    "assess_valve_type_selection": ToolInfo(
+        function=tool_assess_valve_type_selection,
+        description="Assess mechanical vs biological valve selection",
+    ),
+    "calculate_inr_target_mhv": ToolInfo(
+        function=tool_calculate_inr_target_mhv,
+        description="Calculate INR target for mechanical heart valve",
+    ),
     
     # ==========================================================================
     # NEW DEVICE ASSESSMENTS
     # ==========================================================================
-    "assess_crt_indication": {
-        "function": tool_assess_crt_indication,
-        "description": "Assess CRT indication based on ESC guidelines",
-    },
-    "assess_dcm_icd_indication": {
-        "function": tool_assess_dcm_icd_indication,
-        "description": "Assess ICD indication in dilated cardiomyopathy",
-    },
-    "assess_arvc_icd_indication": {
-        "function": tool_assess_arvc_icd_indication,
-        "description": "Assess ICD indication in ARVC",
-    },
-    "assess_sarcoidosis_icd_indication": {
-        "function": tool_assess_sarcoidosis_icd_indication,
-        "description": "Assess ICD indication in cardiac sarcoidosis",
-    },
-    "assess_pacing_indication": {
-        "function": tool_assess_pacing_indication,
-        "description": "Assess pacemaker indication for bradycardia",
-    },
-    "select_pacing_mode": {
-        "function": tool_select_pacing_mode,
-        "description": "Select appropriate pacing mode (DDD, VVI, etc.)",
-    },
+    "assess_crt_indication": ToolInfo(
+        function=tool_assess_crt_indication,
+        description="Assess CRT indication based on ESC guidelines",
+    ),
+    "assess_dcm_icd_indication": ToolInfo(
+        function=tool_assess_dcm_icd_indication,
+        description="Assess ICD indication in dilated cardiomyopathy",
+    ),
+    "assess_arvc_icd_indication": ToolInfo(
+        function=tool_assess_arvc_icd_indication,
+        description="Assess ICD indication in ARVC",
+    ),
+    "assess_sarcoidosis_icd_indication": ToolInfo(
+        function=tool_assess_sarcoidosis_icd_indication,
+        description="Assess ICD indication in cardiac sarcoidosis",
+    ),
+    "assess_pacing_indication": ToolInfo(
+        function=tool_assess_pacing_indication,
+        description="Assess pacemaker indication for bradycardia",
+    ),
+    "select_pacing_mode": ToolInfo(
+        function=tool_select_pacing_mode,
+        description="Select appropriate pacing mode (DDD, VVI, etc.)",
+    ),
     
     # ==========================================================================
     # NEW VTE ASSESSMENTS
     # ==========================================================================
-    "assess_pe_risk_stratification": {
-        "function": tool_assess_pe_risk_stratification,
-        "description": "Assess PE risk stratification (high/intermediate/low)",
-    },
-    "assess_pe_thrombolysis": {
-        "function": tool_assess_pe_thrombolysis,
-        "description": "Assess thrombolysis indication for PE",
-    },
-    "assess_pe_outpatient_eligibility": {
-        "function": tool_assess_pe_outpatient_eligibility,
-        "description": "Assess eligibility for outpatient PE treatment",
-    },
-    "calculate_vte_recurrence_risk": {
-        "function": tool_calculate_vte_recurrence_risk,
-        "description": "Calculate VTE recurrence risk and anticoagulation duration",
-    },
+    "assess_pe_risk_stratification": ToolInfo(
+        function=tool_assess_pe_risk_stratification,
+        description="Assess PE risk stratification (high/intermediate/low)",
+    ),
+    "assess_pe_thrombolysis": ToolInfo(
+        function=tool_assess_pe_thrombolysis,
+        description="Assess thrombolysis indication for PE",
+    ),
+    "assess_pe_outpatient_eligibility": ToolInfo(
+        function=tool_assess_pe_outpatient_eligibility,
+        description="Assess eligibility for outpatient PE treatment",
+    ),
+    "calculate_vte_recurrence_risk": ToolInfo(
+        function=tool_calculate_vte_recurrence_risk,
+        description="Calculate VTE recurrence risk and anticoagulation duration",
+    ),
     
     # ==========================================================================
     # NEW CARDIO-ONCOLOGY ASSESSMENTS
     # ==========================================================================
-    "assess_cardio_oncology_baseline_risk": {
-        "function": tool_assess_cardio_oncology_baseline_risk,
-        "description": "Assess baseline CV risk before cardiotoxic cancer therapy (HFA-ICOS)",
-    },
-    "assess_ctrcd_severity": {
-        "function": tool_assess_ctrcd_severity,
-        "description": "Assess cancer therapy-related cardiac dysfunction severity",
-    },
-    "get_surveillance_protocol": {
-        "function": tool_get_surveillance_protocol,
-        "description": "Get surveillance protocol for cardiotoxic cancer therapy",
-    },
+    "assess_cardio_oncology_baseline_risk": ToolInfo(
+        function=tool_assess_cardio_oncology_baseline_risk,
+        description="Assess baseline CV risk before cardiotoxic cancer therapy (HFA-ICOS)",
+    ),
+    "assess_ctrcd_severity": ToolInfo(
+        function=tool_assess_ctrcd_severity,
+        description="Assess cancer therapy-related cardiac dysfunction severity",
+    ),
+    "get_surveillance_protocol": ToolInfo(
+        function=tool_get_surveillance_protocol,
+        description="Get surveillance protocol for cardiotoxic cancer therapy",
+    ),
     
     # ==========================================================================
     # NEW SYNCOPE ASSESSMENTS
     # ==========================================================================
-    "assess_syncope_risk": {
-        "function": tool_assess_syncope_risk,
-        "description": "Assess syncope risk and disposition recommendation",
-    },
-    "classify_syncope_etiology": {
-        "function": tool_classify_syncope_etiology,
-        "description": "Classify likely syncope etiology",
-    },
-    "diagnose_orthostatic_hypotension": {
-        "function": tool_diagnose_orthostatic_hypotension,
-        "description": "Diagnose orthostatic hypotension from BP measurements",
-    },
-    "assess_tilt_test_indication": {
-        "function": tool_assess_tilt_test_indication,
-        "description": "Assess indication for tilt table testing",
-    },
+    "assess_syncope_risk": ToolInfo(
+        function=tool_assess_syncope_risk,
+        description="Assess syncope risk and disposition recommendation",
+    ),
+    "classify_syncope_etiology": ToolInfo(
+        function=tool_classify_syncope_etiology,
+        description="Classify likely syncope etiology",
+    ),
+    "diagnose_orthostatic_hypotension": ToolInfo(
+        function=tool_diagnose_orthostatic_hypotension,
+        description="Diagnose orthostatic hypotension from BP measurements",
+    ),
+    "assess_tilt_test_indication": ToolInfo(
+        function=tool_assess_tilt_test_indication,
+        description="Assess indication for tilt table testing",
+    ),
     
     # ==========================================================================
     # NEW CLINICAL PATHWAYS
     # ==========================================================================
-    "pathway_hfref_treatment": {
-        "function": tool_pathway_hfref_treatment,
-        "description": "HFrEF treatment pathway - determine next therapy step",
-    },
-    "pathway_hf_device_therapy": {
-        "function": tool_pathway_hf_device_therapy,
-        "description": "HF device therapy pathway - ICD and CRT decision support",
-    },
-    "get_hf_medication_targets": {
-        "function": tool_get_hf_medication_targets,
-        "description": "Get target doses for HF medications",
-    },
-    "pathway_vt_acute_management": {
-        "function": tool_pathway_vt_acute_management,
-        "description": "Acute VT management pathway",
-    },
-    "pathway_electrical_storm": {
-        "function": tool_pathway_electrical_storm,
-        "description": "Electrical storm management pathway",
-    },
-    "pathway_vt_chronic_management": {
-        "function": tool_pathway_vt_chronic_management,
-        "description": "Chronic VT management pathway",
-    },
-    "pathway_pe_treatment": {
-        "function": tool_pathway_pe_treatment,
-        "description": "PE treatment pathway",
-    },
-    "pathway_pe_anticoagulation_duration": {
-        "function": tool_pathway_pe_anticoagulation_duration,
-        "description": "PE anticoagulation duration pathway",
-    },
-    "pathway_syncope_evaluation": {
-        "function": tool_pathway_syncope_evaluation,
-        "description": "Syncope evaluation pathway",
-    },
-    "pathway_syncope_disposition": {
-        "function": tool_pathway_syncope_disposition,
-        "description": "Syncope disposition pathway",
-    },
+    "pathway_hfref_treatment": ToolInfo(
+        function=tool_pathway_hfref_treatment,
+        description="HFrEF treatment pathway - determine next therapy step",
+    ),
+    "pathway_hf_device_therapy": ToolInfo(
+        function=tool_pathway_hf_device_therapy,
+        description="HF device therapy pathway - ICD and CRT decision support",
+    ),
+    "get_hf_medication_targets": ToolInfo(
+        function=tool_get_hf_medication_targets,
+        description="Get target doses for HF medications",
+    ),
+    "pathway_vt_acute_management": ToolInfo(
+        function=tool_pathway_vt_acute_management,
+        description="Acute VT management pathway",
+    ),
+    "pathway_electrical_storm": ToolInfo(
+        function=tool_pathway_electrical_storm,
+        description="Electrical storm management pathway",
+    ),
+    "pathway_vt_chronic_management": ToolInfo(
+        function=tool_pathway_vt_chronic_management,
+        description="Chronic VT management pathway",
+    ),
+    "pathway_pe_treatment": ToolInfo(
+        function=tool_pathway_pe_treatment,
+        description="PE treatment pathway",
+    ),
+    "pathway_pe_anticoagulation_duration": ToolInfo(
+        function=tool_pathway_pe_anticoagulation_duration,
+        description="PE anticoagulation duration pathway",
+    ),
+    "pathway_syncope_evaluation": ToolInfo(
+        function=tool_pathway_syncope_evaluation,
+        description="Syncope evaluation pathway",
+    ),
+    "pathway_syncope_disposition": ToolInfo(
+        function=tool_pathway_syncope_disposition,
+        description="Syncope disposition pathway",
+    ),
     
     # ==========================================================================
     # KNOWLEDGE BASE
     # ==========================================================================
-    "process_pdfs": {
-        "function": tool_process_pdfs,
-        "description": "Process all guideline PDFs to extract searchable knowledge",
-    },
-    "search_knowledge": {
-        "function": tool_search_knowledge,
-        "description": "Search extracted guideline content for clinical questions",
-    },
-    "get_knowledge_status": {
-        "function": tool_get_knowledge_status,
-        "description": "Get status of processed guidelines in knowledge base",
-    },
-    "get_chapter": {
-        "function": tool_get_chapter,
-        "description": "Get full content of a specific guideline chapter",
-    },
-}
+    "process_pdfs": ToolInfo(
+        function=tool_process_pdfs,
+        description="Process all guideline PDFs to extract searchable knowledge",
+    ),
+    "search_knowledge": ToolInfo(
+        function=tool_search_knowledge,
+        description="Search extracted guideline content for clinical questions",
+    ),
+    "get_knowledge_status": ToolInfo(
+        function=tool_get_knowledge_status,
+        description="Get status of processed guidelines in knowledge base",
+    ),
+    "get_chapter": ToolInfo(
+        function=tool_get_chapter,
+        description="Get full content of a specific guideline chapter",
+    ),
+})
+
+# Registered tool names, for membership checks at dispatch
+TOOL_NAMES = frozenset(TOOL_REGISTRY)
+
+# Registration-ordered names reported back for unknown tools
+_AVAILABLE_TOOLS = tuple(TOOL_REGISTRY)
 
 
 def call_tool(name: str, arguments: Dict[str, Any]) -> Any:
     """Call a tool by name with arguments."""
-    if name not in TOOL_REGISTRY:
-        return {"error": f"Unknown tool: {name}", "available_tools": list(TOOL_REGISTRY.keys())}
+    if name not in TOOL_NAMES:
+        return {"error": f"Unknown tool: {name}", "available_tools": _AVAILABLE_TOOLS}
     
-    tool_info = TOOL_REGISTRY[name]
-    func = tool_info["function"]
+    func = TOOL_REGISTRY[name].function
     
     try:
         return func(**arguments)